@@ -4,27 +4,38 @@
 Main runner script for NewsLocator application.
 
 This script orchestrates the collection of news articles from RSS feeds and their
-analysis to identify cities mentioned in or related to the content. It saves both
-the collected articles and analysis results to JSON files.
+analysis to identify cities mentioned in or related to the content. It streams both
+the collected articles and analysis results to JSON Lines files as they become
+available.
 
 Usage:
     python run_locator.py
+    python run_locator.py --batch
+    python run_locator.py --collect-batch <batch_id>
+    python run_locator.py --pretty
+
+With --batch, the collected articles are submitted as a DeepSeek batch job and
+the script exits; running it again with --collect-batch downloads the results
+once the job has completed. With --pretty, the analysis results are also written
+as an indented JSON array for reading by hand.
 
 Dependencies:
     - collector: For fetching articles from RSS feeds
     - analyzer: For identifying cities in article content
+    - batch_submit: For submitting and collecting batch jobs
+    - storage: For writing JSON Lines output
     - logging: For tracking execution
-    - os, json, datetime: For file operations and timestamps
+    - argparse, os, datetime: For arguments, file operations and timestamps
 
 Example:
     >>> python run_locator.py
     🚀 Starting NewsLocator process
     📰 Collecting articles from Fox News
     🔍 Analyzing articles for city mentions
-    ✅ Process complete! Results saved to output/analysis_2025-03-01.json
+    ✅ Process complete! Results saved to output/analysis_2025-03-01.jsonl
 """
 
-import json
+import argparse
 import logging
 import os
 from datetime import datetime
@@ -32,6 +43,8 @@ from datetime import datetime
 from dotenv import load_dotenv
 from src.collector import collect_articles
 from src.analyzer import analyze_locations
+from src.batch_submit import collect_batch, submit_batch
+from src.storage import write_line, write_pretty
 
 # Load environment variables
 load_dotenv()
@@ -63,43 +76,124 @@ logging.basicConfig(
 logger = logging.getLogger("newslocator")
 
 
-def run():
+def collect(current_date: str) -> list:
+    """
+    Collect articles from RSS feeds, writing each one as it arrives.
+    
+    Args:
+        current_date (str): Date used in the output filename
+        
+    Returns:
+        list: The collected article dictionaries
+    """
+    print("📰 Collecting articles from Fox News")
+    articles_file = f"data/articles_{current_date}.jsonl"
+    articles = []
+    with open(articles_file, "w", encoding="utf-8") as f:
+        for article in collect_articles():
+            write_line(f, article)
+            articles.append(article)
+    
+    logger.info(f"Collected {len(articles)} articles and saved to {articles_file}")
+    return articles
+
+
+def run(batch: bool = False, collect_batch_id: str = None, pretty: bool = False):
     """
     Run the NewsLocator process.
     
     Collects articles from Fox News RSS feed, analyzes them to identify
-    mentioned cities, and saves both the collected articles and analysis results
-    to JSON files with timestamps.
+    mentioned cities, and writes both the collected articles and analysis results
+    to timestamped JSON Lines files, one record per line as each becomes available.
+    
+    Args:
+        batch (bool): Submit the analysis as a batch job and exit instead of
+            analyzing the articles directly
+        collect_batch_id (str, optional): Skip collection and write the results
+            of a previously submitted batch job
+        pretty (bool): Also write the analysis results as an indented JSON array
     """
     logger.info("Starting NewsLocator process")
     print("🚀 Starting NewsLocator process")
     
     # Get current date for filenames
     current_date = datetime.now().strftime("%Y-%m-%d")
+    analysis_file = f"output/analysis_{current_date}.jsonl"
     
-    # Collect articles from RSS feeds
-    print("📰 Collecting articles from Fox News")
-    articles = collect_articles()
+    if collect_batch_id:
+        print(f"📥 Collecting results of batch {collect_batch_id}")
+        results = collect_batch(collect_batch_id)
+        if results is None:
+            print(f"⏳ Batch {collect_batch_id} has not completed yet, try again later")
+            return
+        
+        with open(analysis_file, "w", encoding="utf-8") as f:
+            for result in results:
+                write_line(f, result)
+        
+        if pretty:
+            write_pretty(f"output/analysis_{current_date}.json", results)
+        
+        logger.info(f"Batch results saved to {analysis_file}")
+        print(f"✅ Process complete! Results saved to {analysis_file}")
+        return
     
-    # Save collected articles to JSON
-    articles_file = f"data/articles_{current_date}.json"
-    with open(articles_file, "w", encoding="utf-8") as f:
-        json.dump(articles, f, indent=2)
+    articles = collect(current_date)
     
-    logger.info(f"Collected {len(articles)} articles and saved to {articles_file}")
+    if batch:
+        if not articles:
+            logger.warning("No articles to submit, skipping batch job")
+            print("⚠️ No articles to submit, skipping batch job")
+            return
+        
+        print("📤 Submitting articles as a batch job")
+        batch_id = submit_batch(articles)
+        if batch_id is not None:
+            print(f"✅ Submitted batch {batch_id}. Collect results with: python run_locator.py --collect-batch {batch_id}")
+            return
+        
+        # Every article is already cached, so the direct analysis below makes no API calls
+        print("♻️ All articles were analyzed before, writing cached results")
     
-    # Analyze articles for city mentions
+    # Analyze articles for city mentions, writing each result as it completes
     print("🔍 Analyzing articles for city mentions")
-    analysis_results = analyze_locations(articles)
-    
-    # Save analysis results to JSON
-    analysis_file = f"output/analysis_{current_date}.json"
     with open(analysis_file, "w", encoding="utf-8") as f:
-        json.dump(analysis_results, f, indent=2)
+        results = analyze_locations(articles, on_result=lambda result: write_line(f, result))
+    
+    if pretty:
+        write_pretty(f"output/analysis_{current_date}.json", results)
     
     logger.info(f"Analysis complete and saved to {analysis_file}")
     print(f"✅ Process complete! Results saved to {analysis_file}")
 
 
+def parse_args() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="Identify cities related to recent news articles.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--batch",
+        action="store_true",
+        help="submit the analysis as a DeepSeek batch job and exit",
+    )
+    mode.add_argument(
+        "--collect-batch",
+        metavar="BATCH_ID",
+        help="write the results of a previously submitted batch job",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="also write the analysis results as an indented JSON array",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    run() 
\ No newline at end of file
+    args = parse_args()
+    run(batch=args.batch, collect_batch_id=args.collect_batch, pretty=args.pretty)
@@ -3,12 +3,16 @@ City location analyzer for news articles using DeepSeek API.
 
 This module analyzes news articles to identify cities mentioned in or related to
 the content. It uses the DeepSeek API to process article text and extract city
-references with supporting rationale. The analysis is performed in batches to
-optimize API usage, with configurable delays between requests.
+references with supporting rationale. Several articles are packed into each API
+request, and requests are issued concurrently with asyncio, with the number of
+in-flight requests bounded by a semaphore and the request rate shaped by a
+token-bucket rate limiter. Responses are streamed and cut off as soon as the
+JSON result is complete. Results are cached by article content, so articles
+seen in a previous run are not sent to the API again.
 
 Dependencies:
     - openai: For DeepSeek API integration
-    - tenacity: For retry logic on API errors
+    - tenacity: For retry logic on transient API errors
     - logging: For error tracking
     - dotenv: For environment variable loading
 
@@ -20,14 +24,24 @@ Usage:
     ["London"]
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
+import shelve
+import textwrap
 import time
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, List, Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    InternalServerError,
+    RateLimitError,
+)
 from tenacity import (
     retry,
     stop_after_attempt,
@@ -43,8 +57,337 @@ logger = logging.getLogger("newslocator.analyzer")
 
 # DeepSeek API configuration
 DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
-BATCH_SIZE = 3  # Process articles in batches of 3
-INTER_BATCH_DELAY = int(os.getenv("INTER_BATCH_DELAY", "2"))  # Use a separate env var with shorter default
+DEEPSEEK_BASE_URL = "https://api.deepseek.com/v1"
+DEEPSEEK_MODEL = os.getenv("DEEPSEEK_MODEL", "deepseek-chat")
+MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "3"))  # Maximum in-flight API requests
+ARTICLES_PER_REQUEST = int(os.getenv("ARTICLES_PER_REQUEST", "5"))  # Articles packed into one request
+MAX_TOKENS = 500  # Completion budget for a single-article request
+MAX_TOKENS_PER_ARTICLE = 200  # Completion budget per article in a multi-article request
+REQUESTS_PER_MINUTE = int(os.getenv("DEEPSEEK_RPM", "60"))  # Request budget per minute
+TOKENS_PER_MINUTE = int(os.getenv("DEEPSEEK_TPM", "100000"))  # Token budget per minute
+CHARS_PER_TOKEN = 4  # Rough characters-per-token ratio used to estimate prompt size
+CACHE_PATH = os.getenv("ANALYSIS_CACHE_PATH", "data/.llm_cache")  # On-disk analysis cache
+ANALYSIS_FIELDS = ("cities", "rationale", "error")  # Fields the analysis adds to an article
+
+# Transient API errors worth retrying; anything else would fail again the same way
+RETRYABLE_API_ERRORS = (APIConnectionError, APITimeoutError, RateLimitError, InternalServerError)
+
+
+# System message with the task rules and response format. It is identical across
+# requests, so DeepSeek's prefix cache can reuse it. The source indentation is
+# stripped once here so it is not sent with every request.
+SYSTEM_MESSAGE = textwrap.dedent("""
+    You are a geographic analysis expert specializing in identifying cities mentioned in news articles.
+
+    TASK:
+    Analyze the news article provided by the user and identify which cities are mentioned or directly related to the content.
+
+    INSTRUCTIONS:
+    1. Identify all cities explicitly mentioned in the article.
+    2. Identify cities that are strongly implied or directly related to the content.
+    3. If no cities are explicitly mentioned, make an educated guess about which cities might be related based on context clues.
+    4. Do NOT include countries, regions, states, or other non-city locations.
+    5. Provide a detailed rationale for each city you identify or guess.
+
+    RESPONSE FORMAT:
+    Respond in valid JSON format with the following structure:
+    {
+    "cities": ["City1", "City2", ...],
+    "rationale": "Your explanation for why these cities are mentioned or related to the article"
+    }
+
+    Even if no cities are explicitly mentioned, provide your best guess based on context:
+    {
+    "cities": ["GuessedCity1", "GuessedCity2"],
+    "rationale": "While no cities are explicitly mentioned, the article likely relates to [GuessedCity1] because... and [GuessedCity2] because..."
+    }
+
+    Only in cases where it's impossible to make any reasonable guess, return:
+    {
+    "cities": [],
+    "rationale": "No specific cities are mentioned or can be reasonably inferred from this article."
+    }
+    """).strip()
+
+# System message for analyzing several articles in a single request
+MULTI_SYSTEM_MESSAGE = textwrap.dedent("""
+    You are a geographic analysis expert specializing in identifying cities mentioned in news articles.
+
+    TASK:
+    Analyze each of the numbered news articles provided by the user independently and identify which cities are mentioned or directly related to its content.
+
+    INSTRUCTIONS:
+    1. Identify all cities explicitly mentioned in each article.
+    2. Identify cities that are strongly implied or directly related to the content.
+    3. If no cities are explicitly mentioned, make an educated guess about which cities might be related based on context clues.
+    4. Do NOT include countries, regions, states, or other non-city locations.
+    5. Provide a detailed rationale for each article.
+
+    RESPONSE FORMAT:
+    Respond in valid JSON format with a "results" array containing exactly one object per article, using the article's number as "index":
+    {
+    "results": [
+    {"index": 1, "cities": ["City1", "City2", ...], "rationale": "Your explanation for article 1"},
+    {"index": 2, "cities": [], "rationale": "No specific cities are mentioned or can be reasonably inferred from this article."}
+    ]
+    }
+    """).strip()
+
+# Identifies the model and prompts that produced a cached result, so changing
+# either one stops earlier results from being served
+_CACHE_VERSION = hashlib.blake2b(
+    f"{DEEPSEEK_MODEL}\0{SYSTEM_MESSAGE}\0{MULTI_SYSTEM_MESSAGE}".encode("utf-8"), digest_size=8
+).hexdigest()
+
+
+def cache_key(article: Dict) -> str:
+    """
+    Compute the cache key for an article from the content sent to the API.
+    
+    The key also covers the model and system prompts in use, so results cached
+    under a different model or prompt are not reused.
+    
+    Args:
+        article (dict): Article dictionary with title, description, and categories
+        
+    Returns:
+        str: Hex digest identifying the article content
+    """
+    title = article.get("title", "")
+    description = article.get("description", "")
+    categories = ", ".join(article.get("categories", []))
+    return hashlib.blake2b(
+        f"{_CACHE_VERSION}\0{title}\0{description}\0{categories}".encode("utf-8"), digest_size=16
+    ).hexdigest()
+
+
+def format_article(article: Dict) -> str:
+    """
+    Format the article content sent to the API as the user message.
+    
+    Args:
+        article (dict): Article dictionary with title, description, and categories
+        
+    Returns:
+        str: The title, description, and categories on separate lines
+    """
+    categories = ", ".join(article.get("categories", []))
+    return f"Title: {article.get('title', '')}\nDescription: {article.get('description', '')}\nCategories: {categories}"
+
+
+def load_json_object(content: str) -> Dict[str, Any]:
+    """
+    Parse a JSON object from an API response.
+    
+    Responses are requested in JSON mode, so the content is normally valid JSON
+    as-is. If it is not, the outermost ``{...}`` span is parsed instead, which
+    also covers responses wrapped in markdown code fences.
+    
+    Args:
+        content (str): Raw response text
+        
+    Returns:
+        dict: The parsed JSON object
+        
+    Raises:
+        ValueError: If no valid JSON object can be extracted
+    """
+    try:
+        result = json.loads(content)
+    except json.JSONDecodeError:
+        result = json.loads(content[content.find("{"):content.rfind("}") + 1])
+    
+    if not isinstance(result, dict):
+        raise ValueError("Response is not a JSON object")
+    return result
+
+
+class _JsonObjectScanner:
+    """
+    Detect the end of a JSON object arriving in streamed chunks.
+    
+    Tracks brace depth across chunks, ignoring braces inside JSON strings, so the
+    caller can tell when the top-level object has been closed without re-parsing
+    the accumulated text after every chunk.
+    """
+    
+    def __init__(self):
+        """Initialize the scanner before the opening brace has been seen."""
+        self.depth = 0
+        self.started = False
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next chunk of streamed text.
+        
+        Args:
+            chunk (str): The next piece of the response
+            
+        Returns:
+            bool: True once the top-level JSON object has been closed
+        """
+        for char in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}" and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket rate limiter for API requests and tokens.
+    
+    Request and token capacity refill continuously at the configured per-minute
+    rates, so callers only wait when they would actually exceed the limits,
+    rather than sleeping a fixed amount between every request.
+    """
+    
+    def __init__(self, rpm: int, tpm: int):
+        """
+        Initialize the rate limiter with full capacity.
+        
+        Args:
+            rpm (int): Maximum number of requests per minute
+            tpm (int): Maximum number of tokens per minute
+        """
+        self.rpm = rpm
+        self.tpm = tpm
+        self.available_request_capacity = float(rpm)
+        self.available_token_capacity = float(tpm)
+        self._last_update = time.monotonic()
+        self._lock = None
+    
+    def _refill(self):
+        """Add the capacity accrued since the last update, capped at the per-minute limits."""
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        self.available_request_capacity = min(
+            self.rpm, self.available_request_capacity + self.rpm * elapsed / 60.0
+        )
+        self.available_token_capacity = min(
+            self.tpm, self.available_token_capacity + self.tpm * elapsed / 60.0
+        )
+    
+    async def acquire(self, estimated_tokens: int = 0):
+        """
+        Wait until there is capacity for one request of the given size, then consume it.
+        
+        Args:
+            estimated_tokens (int): Estimated prompt plus completion tokens for the request
+        """
+        # Created lazily so the lock belongs to the running event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        
+        # A single request larger than the whole budget would otherwise wait forever
+        tokens = min(estimated_tokens, self.tpm)
+        
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available_request_capacity >= 1 and self.available_token_capacity >= tokens:
+                    self.available_request_capacity -= 1
+                    self.available_token_capacity -= tokens
+                    return
+                
+                # Sleep just long enough for the scarcer resource to refill
+                wait = max(
+                    (1 - self.available_request_capacity) * 60.0 / self.rpm,
+                    (tokens - self.available_token_capacity) * 60.0 / self.tpm,
+                )
+                logger.debug(f"Rate limit reached, waiting {wait:.2f} seconds")
+                await asyncio.sleep(wait)
+
+
+class AnalysisCache:
+    """
+    Cache of analysis results keyed by ``cache_key``.
+    
+    An in-process dict sits in front of an on-disk shelf that is opened on first
+    use and persists results across runs. Direct and batch analysis share it, so
+    an article analyzed either way is not sent to the API again.
+    """
+    
+    def __init__(self, path: str = CACHE_PATH):
+        """
+        Initialize an empty cache backed by the shelf at ``path``.
+        
+        Args:
+            path (str): Location of the on-disk shelf
+        """
+        self.path = path
+        self._memory = {}
+        self._disk = None
+    
+    def _open_disk(self) -> shelve.Shelf:
+        """
+        Open the on-disk shelf on first use.
+        
+        Returns:
+            shelve.Shelf: The persistent cache mapping keys to analysis results
+        """
+        if self._disk is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._disk = shelve.open(self.path)
+        return self._disk
+    
+    def get(self, key: str) -> Optional[Dict]:
+        """
+        Look up a cached analysis result.
+        
+        Args:
+            key (str): Cache key from ``cache_key``
+            
+        Returns:
+            dict: The cached 'cities' and 'rationale', or None on a miss
+        """
+        if key in self._memory:
+            return self._memory[key]
+        
+        result = self._open_disk().get(key)
+        if result is not None:
+            self._memory[key] = result
+        return result
+    
+    def set(self, key: str, article_result: Dict):
+        """
+        Cache the analysis fields of a successfully analyzed article.
+        
+        Args:
+            key (str): Cache key from ``cache_key``
+            article_result (dict): Article with added 'cities' and 'rationale' fields
+        """
+        if "error" in article_result:
+            return
+        
+        result = {
+            "cities": article_result["cities"],
+            "rationale": article_result["rationale"],
+        }
+        self._memory[key] = result
+        self._open_disk()[key] = result
+    
+    def close(self):
+        """Flush and close the on-disk shelf if it was opened."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
 
 
 class LocationAnalyzer:
@@ -60,217 +403,357 @@ class LocationAnalyzer:
         """
         Initialize the LocationAnalyzer with DeepSeek API client.
         
-        Sets up the OpenAI client configured for DeepSeek API access and defines
-        the prompt template for city identification.
+        Sets up the async OpenAI client configured for DeepSeek API access and
+        defines the system and user messages for city identification.
         """
-        self.client = OpenAI(
-            base_url="https://api.deepseek.com/v1",
+        self.client = AsyncOpenAI(
+            base_url=DEEPSEEK_BASE_URL,
             api_key=DEEPSEEK_API_KEY,
             timeout=30.0,
         )
-        self.model = "deepseek-chat"
-        
-        # Prompt template for city identification
-        self.prompt_template = """
-            You are a geographic analysis expert specializing in identifying cities mentioned in news articles.
-
-            TASK:
-            Analyze the following news article and identify which cities are mentioned or directly related to the content.
-
-            ARTICLE:
-            Title: {title}
-            Description: {description}
-            Categories: {categories}
-
-            INSTRUCTIONS:
-            1. Identify all cities explicitly mentioned in the article.
-            2. Identify cities that are strongly implied or directly related to the content.
-            3. If no cities are explicitly mentioned, make an educated guess about which cities might be related based on context clues.
-            4. Do NOT include countries, regions, states, or other non-city locations.
-            5. Provide a detailed rationale for each city you identify or guess.
-
-            RESPONSE FORMAT:
-            Respond in valid JSON format with the following structure:
-            {{
-            "cities": ["City1", "City2", ...],
-            "rationale": "Your explanation for why these cities are mentioned or related to the article"
-            }}
-
-            Even if no cities are explicitly mentioned, provide your best guess based on context:
-            {{
-            "cities": ["GuessedCity1", "GuessedCity2"],
-            "rationale": "While no cities are explicitly mentioned, the article likely relates to [GuessedCity1] because... and [GuessedCity2] because..."
-            }}
-
-            Only in cases where it's impossible to make any reasonable guess, return:
-            {{
-            "cities": [],
-            "rationale": "No specific cities are mentioned or can be reasonably inferred from this article."
-            }}
-            """
+        self.model = DEEPSEEK_MODEL
+        self.limiter = AsyncRateLimiter(REQUESTS_PER_MINUTE, TOKENS_PER_MINUTE)
+        self.cache = AnalysisCache()
+        
+        # Static system messages, shared by every request
+        self.system_message = SYSTEM_MESSAGE
+        self.multi_system_message = MULTI_SYSTEM_MESSAGE
+
+    async def analyze_article(self, article: Dict) -> Dict:
+        """
+        Analyze a single article to identify mentioned cities.
+        
+        Returns the cached result if the same article content was analyzed
+        before; otherwise sends the article content to the DeepSeek API with a
+        structured prompt and parses the response to extract cities and rationale.
+        Only the API call itself is retried; the prompt is built once and the
+        response parsed once.
+        
+        Args:
+            article (dict): Article dictionary with title, description, and categories
+            
+        Returns:
+            dict: The original article with added 'cities' and 'rationale' fields,
+            or with an 'error' field if the analysis failed
+        """
+        # Reuse a previous analysis of identical content
+        key = cache_key(article)
+        cached = self.cache.get(key)
+        if cached is not None:
+            article_result = article.copy()
+            article_result.update(cached)
+            return article_result
+        
+        # Format the user message with article content
+        user_message = format_article(article)
+        
+        article_result = article.copy()
+        
+        try:
+            content = await self._call_api(self.system_message, user_message, MAX_TOKENS)
+        except Exception as e:
+            logger.error(f"API request failed: {e}")
+            
+            # Return article with error information
+            article_result["cities"] = []
+            article_result["rationale"] = f"Error: {str(e)}"
+            article_result["error"] = str(e)
+            return article_result
+        
+        try:
+            result = load_json_object(content)
+        except ValueError as e:
+            logger.error(f"Failed to parse API response as JSON: {e}")
+            logger.error(f"Raw response: {content}")
+            
+            # Return article with error information
+            article_result["cities"] = []
+            article_result["rationale"] = "Error parsing analysis results"
+            article_result["error"] = str(e)
+            return article_result
+        
+        # Add analysis results to the article
+        article_result["cities"] = result.get("cities", [])
+        article_result["rationale"] = result.get("rationale", "No rationale provided")
+        self.cache.set(key, article_result)
+        return article_result
 
     @retry(
         stop=stop_after_attempt(3),
         wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((Exception)),
+        retry=retry_if_exception_type(RETRYABLE_API_ERRORS),
+        reraise=True,
     )
-    def analyze_article(self, article: Dict) -> Dict:
+    async def _call_api(self, system_message: str, user_message: str, max_tokens: int) -> str:
         """
-        Analyze a single article to identify mentioned cities.
+        Send a system and user message to the DeepSeek API and return the raw response text.
         
-        Sends the article content to the DeepSeek API with a structured prompt
-        and parses the response to extract cities and rationale.
+        The response is streamed and the stream is closed as soon as the top-level
+        JSON object is complete, freeing the concurrency slot without waiting for
+        any trailing tokens.
         
         Args:
-            article (dict): Article dictionary with title, description, and categories
+            system_message (str): The static system message with task instructions
+            user_message (str): The per-request user message with article content
+            max_tokens (int): Maximum number of tokens to generate
             
         Returns:
-            dict: The original article with added 'cities' and 'rationale' fields
+            str: The streamed content of the first completion choice
             
         Raises:
-            Exception: If the API request fails after retries
+            openai.APIError: If the API request fails, after retrying transient errors
         """
-        # Format the prompt with article content
-        categories_str = ", ".join(article.get("categories", []))
-        prompt = self.prompt_template.format(
-            title=article.get("title", ""),
-            description=article.get("description", ""),
-            categories=categories_str,
+        await self.limiter.acquire(self._estimate_tokens(system_message + user_message, max_tokens))
+        stream = await self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": user_message},
+            ],
+            temperature=0.1,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            stream=True,
         )
         
+        parts = []
+        scanner = _JsonObjectScanner()
         try:
-            # Call DeepSeek API
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "system", "content": prompt}],
-                temperature=0.1,
-                max_tokens=500,
-            )
+            async for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                parts.append(delta)
+                if scanner.feed(delta):
+                    # The JSON object is complete, so stop waiting for trailing tokens
+                    break
+        finally:
+            await stream.close()
+        
+        return "".join(parts)
+
+    @staticmethod
+    def _estimate_tokens(text: str, max_tokens: int) -> int:
+        """
+        Estimate the tokens a request will consume against the rate limit.
+        
+        Args:
+            text (str): The full prompt text sent with the request
+            max_tokens (int): Maximum number of tokens to generate
             
-            # Extract and parse the response
-            content = response.choices[0].message.content if response.choices else ""
+        Returns:
+            int: Approximate prompt tokens plus the completion budget
+        """
+        return len(text) // CHARS_PER_TOKEN + max_tokens
+
+    @staticmethod
+    def _parse_multi_response(content: str, count: int) -> Dict[int, Dict]:
+        """
+        Parse a multi-article response into analysis results keyed by article index.
+        
+        Args:
+            content (str): Raw response text containing a JSON object with a "results" array
+            count (int): Number of articles that were sent in the request
             
-            # Extract JSON from the response - handle code block format
-            try:
-                # Check if response is in a code block format (```json ... ```)
-                if "```json" in content:
-                    # Extract content between ```json and ```
-                    import re
-                    json_match = re.search(r'```json\s*(.*?)\s*```', content, re.DOTALL)
-                    if json_match:
-                        json_content = json_match.group(1)
-                        result = json.loads(json_content)
-                    else:
-                        # Fallback to trying to parse the whole content
-                        result = json.loads(content)
-                else:
-                    # Try to find JSON content directly
-                    json_match = content.strip()
-                    if not json_match.startswith("{"):
-                        # Try to find the start of JSON
-                        start_idx = content.find("{")
-                        if start_idx != -1:
-                            json_match = content[start_idx:]
-                    
-                    result = json.loads(json_match)
-                
-                # Ensure expected fields exist
-                if "cities" not in result:
-                    result["cities"] = []
-                if "rationale" not in result:
-                    result["rationale"] = "No rationale provided"
-                    
-                # Add analysis results to the article
-                article_result = article.copy()
-                article_result["cities"] = result["cities"]
-                article_result["rationale"] = result["rationale"]
-                return article_result
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse API response as JSON: {e}")
-                logger.error(f"Raw response: {content}")
-                
-                # Return article with error information
-                article_result = article.copy()
-                article_result["cities"] = []
-                article_result["rationale"] = "Error parsing analysis results"
-                article_result["error"] = str(e)
-                return article_result
-                
-        except Exception as e:
-            logger.error(f"API request failed: {e}")
+        Returns:
+            dict: Mapping of 1-based article index to its analysis result
             
-            # Return article with error information
+        Raises:
+            ValueError: If the response does not contain a result for every article
+        """
+        # json.JSONDecodeError is a ValueError, so malformed JSON is reported the same way
+        items = load_json_object(content).get("results")
+        if not isinstance(items, list):
+            raise ValueError("Response has no 'results' array")
+        
+        results = {}
+        for item in items:
+            if isinstance(item, dict) and isinstance(item.get("index"), int):
+                results[item["index"]] = item
+        
+        missing = [index for index in range(1, count + 1) if index not in results]
+        if missing:
+            raise ValueError(f"Response is missing results for articles {missing}")
+        
+        return results
+
+    async def analyze_multi(self, articles: List[Dict]) -> List[Dict]:
+        """
+        Analyze several articles with a single API request.
+        
+        The articles are packed into one numbered user message and the model returns
+        a JSON "results" array, which is matched back to the articles by index.
+        If the response cannot be parsed, the chunk is split in half and each half
+        is retried, down to single articles which use ``analyze_article``.
+        
+        Args:
+            articles (list): List of article dictionaries to analyze together
+            
+        Returns:
+            list: The articles with added 'cities' and 'rationale' fields
+            
+        Raises:
+            openai.APIError: If the API request fails, after retrying transient errors
+        """
+        if len(articles) == 1:
+            return [await self.analyze_article(articles[0])]
+        
+        # Format one numbered block per article
+        user_message = "\n\n".join(
+            f"[{index}]\n{format_article(article)}"
+            for index, article in enumerate(articles, start=1)
+        )
+        
+        content = await self._call_api(
+            self.multi_system_message,
+            user_message,
+            max_tokens=MAX_TOKENS_PER_ARTICLE * len(articles),
+        )
+        
+        try:
+            parsed = self._parse_multi_response(content, len(articles))
+        except ValueError as e:
+            logger.warning(f"Failed to parse multi-article response ({e}); splitting {len(articles)} articles")
+            logger.debug(f"Raw response: {content}")
+            middle = len(articles) // 2
+            return await self.analyze_multi(articles[:middle]) + await self.analyze_multi(articles[middle:])
+        
+        # Add analysis results to each article
+        results = []
+        for index, article in enumerate(articles, start=1):
             article_result = article.copy()
-            article_result["cities"] = []
-            article_result["rationale"] = f"Error: {str(e)}"
-            return article_result
+            article_result["cities"] = parsed[index].get("cities", [])
+            article_result["rationale"] = parsed[index].get("rationale", "No rationale provided")
+            self.cache.set(cache_key(article), article_result)
+            results.append(article_result)
+        return results
 
-    def analyze_batch(self, articles: List[Dict]) -> List[Dict]:
+    async def analyze_batch(
+        self,
+        articles: List[Dict],
+        k: int = ARTICLES_PER_REQUEST,
+        max_concurrency: int = MAX_CONCURRENCY,
+        on_result: Optional[Callable[[Dict], None]] = None,
+    ) -> List[Dict]:
         """
-        Analyze a batch of articles for city mentions.
+        Analyze a batch of articles for city mentions concurrently.
         
-        Processes each article in the batch individually, with a small delay
-        between requests to avoid rate limiting.
+        Cached articles are answered without an API call and articles with
+        identical content are only analyzed once. The remaining articles are
+        grouped into chunks of ``k`` which are each analyzed with a
+        single API request, with at most ``max_concurrency`` requests in flight
+        at any time and the request rate shaped by ``self.limiter``. Results are
+        returned in the same order as the input articles.
         
         Args:
             articles (list): List of article dictionaries to analyze
+            k (int): Number of articles to pack into each API request
+            max_concurrency (int): Maximum number of concurrent API requests
+            on_result (callable, optional): Called with each analyzed article as
+                soon as it is resolved from the cache or its chunk completes, in
+                completion order
             
         Returns:
             list: The articles with added city analysis results
         """
-        results = []
+        semaphore = asyncio.Semaphore(max_concurrency)
+        keys = [cache_key(article) for article in articles]
         
-        for i, article in enumerate(articles):
-            try:
-                logger.info(f"Analyzing article: {article.get('title', 'Untitled')[:50]}...")
-                result = self.analyze_article(article)
-                results.append(result)
-                
-                # Add a small delay between articles (except for the last one)
-                if i < len(articles) - 1:
-                    time.sleep(1)
-                    
-            except Exception as e:
-                logger.error(f"Failed to analyze article: {e}")
-                # Add the article with an error flag
-                article_copy = article.copy()
-                article_copy["cities"] = []
-                article_copy["rationale"] = "Analysis failed"
-                article_copy["error"] = str(e)
-                results.append(article_copy)
-                
-        return results
+        # Resolve cache hits up front and send each distinct uncached article once
+        analyses = {}
+        waiting = {}
+        for article, key in zip(articles, keys):
+            if key in analyses:
+                continue
+            if key in waiting:
+                waiting[key].append(article)
+                continue
+            cached = self.cache.get(key)
+            if cached is not None:
+                analyses[key] = cached
+            else:
+                waiting[key] = [article]
+        
+        logger.info(f"{len(articles) - sum(len(group) for group in waiting.values())} articles served from cache, {len(waiting)} to analyze")
+        
+        if on_result is not None:
+            for article, key in zip(articles, keys):
+                if key in analyses:
+                    on_result({**article, **analyses[key]})
+        
+        pending = [group[0] for group in waiting.values()]
+        chunks = [pending[i:i + k] for i in range(0, len(pending), k)]
+        
+        async def _bounded(chunk: List[Dict]):
+            async with semaphore:
+                try:
+                    logger.info(f"Analyzing {len(chunk)} articles starting with: {chunk[0].get('title', 'Untitled')[:50]}...")
+                    chunk_result = await self.analyze_multi(chunk)
+                except Exception as e:
+                    logger.error(f"Failed to analyze articles: {e}")
+                    # Return the articles with an error flag
+                    chunk_result = []
+                    for article in chunk:
+                        article_copy = article.copy()
+                        article_copy["cities"] = []
+                        article_copy["rationale"] = "Analysis failed"
+                        article_copy["error"] = str(e)
+                        chunk_result.append(article_copy)
+            
+            # Record the analysis for every article sharing the same content
+            for result in chunk_result:
+                key = cache_key(result)
+                analyses[key] = {field: result[field] for field in ANALYSIS_FIELDS if field in result}
+                if on_result is not None:
+                    for article in waiting[key]:
+                        on_result({**article, **analyses[key]})
+        
+        await asyncio.gather(*[_bounded(chunk) for chunk in chunks])
+        return [{**article, **analyses[key]} for article, key in zip(articles, keys)]
+
+    async def analyze_all(
+        self,
+        articles: List[Dict],
+        on_result: Optional[Callable[[Dict], None]] = None,
+    ) -> List[Dict]:
+        """
+        Analyze all articles and release the API client and cache afterwards.
+        
+        Args:
+            articles (list): List of article dictionaries to analyze
+            on_result (callable, optional): Called with each analyzed article as it completes
+            
+        Returns:
+            list: The articles with added city analysis results
+        """
+        try:
+            return await self.analyze_batch(articles, on_result=on_result)
+        finally:
+            self.cache.close()
+            await self.client.close()
 
 
-def analyze_locations(articles: List[Dict]) -> List[Dict]:
+def analyze_locations(
+    articles: List[Dict],
+    on_result: Optional[Callable[[Dict], None]] = None,
+) -> List[Dict]:
     """
     Analyze a list of articles to identify mentioned cities.
     
-    Processes articles in batches to optimize API usage, with configurable
-    delays between batches to avoid rate limiting.
+    Runs the analysis on a fresh event loop. Articles are packed
+    ``ARTICLES_PER_REQUEST`` to a request and concurrency against the API is
+    bounded by ``MAX_CONCURRENCY``.
     
     Args:
         articles (list): List of article dictionaries to analyze
+        on_result (callable, optional): Called with each analyzed article as soon
+            as it completes, e.g. to stream results to disk
         
     Returns:
         list: The articles with added city analysis results
     """
     analyzer = LocationAnalyzer()
-    results = []
-    
-    # Process articles in batches
-    for i in range(0, len(articles), BATCH_SIZE):
-        batch = articles[i:i + BATCH_SIZE]
-        logger.info(f"Processing batch {i//BATCH_SIZE + 1} ({len(batch)} articles)")
-        
-        batch_results = analyzer.analyze_batch(batch)
-        results.extend(batch_results)
-        
-        # Add a shorter delay between batches (except for the last one)
-        if i + BATCH_SIZE < len(articles):
-            logger.info(f"Sleeping for {INTER_BATCH_DELAY} seconds before next batch")
-            time.sleep(INTER_BATCH_DELAY)
+    results = asyncio.run(analyzer.analyze_all(articles, on_result=on_result))
     
     logger.info(f"Analysis complete for {len(results)} articles")
     return results
@@ -0,0 +1,261 @@
+"""
+DeepSeek Batch API submission for NewsLocator.
+
+This module submits article analysis as an asynchronous batch job instead of
+issuing chat completion requests directly. It is intended for scheduled,
+non-interactive runs: batch jobs are billed at a discount and are not subject
+to the per-minute request limits, at the cost of results arriving later
+(within a 24 hour completion window).
+
+A run is split in two steps. ``submit_batch`` uploads one chat completion
+request per article that is not already in the analysis cache and starts the
+batch job; ``collect_batch`` downloads the results once the job has completed,
+adds them to the cache and merges them, together with the cached analyses,
+back into the articles.
+
+Dependencies:
+    - openai: For DeepSeek file and batch API access
+    - analyzer: For the prompt and response parsing shared with direct analysis
+    - storage: For writing JSON Lines files
+    - logging: For error tracking
+
+Usage:
+    >>> from src.batch_submit import submit_batch, collect_batch
+    >>> batch_id = submit_batch(articles)  # None if every article is already cached
+    >>> results = collect_batch(batch_id)  # None until the batch has completed
+"""
+
+import json
+import logging
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+from openai import OpenAI
+
+from src.analyzer import (
+    DEEPSEEK_API_KEY,
+    DEEPSEEK_BASE_URL,
+    DEEPSEEK_MODEL,
+    MAX_TOKENS,
+    SYSTEM_MESSAGE,
+    AnalysisCache,
+    cache_key,
+    format_article,
+    load_json_object,
+)
+from src.storage import write_line
+
+# Configure logging
+logger = logging.getLogger("newslocator.batch")
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+COMPLETION_WINDOW = "24h"
+BATCH_DIR = "data/batches"  # Request files and submitted articles per batch
+
+
+def _create_client() -> OpenAI:
+    """
+    Create an OpenAI client configured for DeepSeek API access.
+    
+    Returns:
+        OpenAI: Synchronous API client
+    """
+    return OpenAI(base_url=DEEPSEEK_BASE_URL, api_key=DEEPSEEK_API_KEY, timeout=30.0)
+
+
+def build_request(custom_id: str, article: Dict) -> Dict:
+    """
+    Build the batch request line for a single article.
+    
+    Args:
+        custom_id (str): Identifier used to match the result back to the article
+        article (dict): Article dictionary with title, description, and categories
+        
+    Returns:
+        dict: A batch input line wrapping a chat completion request
+    """
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": DEEPSEEK_MODEL,
+            "messages": [
+                {"role": "system", "content": SYSTEM_MESSAGE},
+                {"role": "user", "content": format_article(article)},
+            ],
+            "temperature": 0.1,
+            "max_tokens": MAX_TOKENS,
+            "response_format": {"type": "json_object"},
+        },
+    }
+
+
+def submit_batch(articles: List[Dict]) -> Optional[str]:
+    """
+    Submit a batch job analyzing the given articles.
+    
+    Articles already in the analysis cache are skipped, and articles with
+    identical content are only submitted once. One request per remaining article
+    is written to a JSON Lines file, uploaded, and started as a batch job. All
+    articles are saved alongside so ``collect_batch`` can merge the results back
+    in a later run.
+    
+    Args:
+        articles (list): List of article dictionaries to analyze
+        
+    Returns:
+        str: The ID of the created batch job, or None if there was nothing to
+        submit because every article is already cached
+    """
+    # Cache keys serve as custom IDs for the articles that need analyzing
+    cache = AnalysisCache()
+    try:
+        pending = {}
+        for article in articles:
+            key = cache_key(article)
+            if key not in pending and cache.get(key) is None:
+                pending[key] = article
+    finally:
+        cache.close()
+    
+    if not pending:
+        logger.info(f"All {len(articles)} articles are already cached, no batch submitted")
+        return None
+    
+    client = _create_client()
+    os.makedirs(BATCH_DIR, exist_ok=True)
+    
+    # The request file gets a unique name so overlapping submissions don't
+    # overwrite each other
+    with tempfile.NamedTemporaryFile(
+        "w", dir=BATCH_DIR, prefix="input_", suffix=".jsonl", encoding="utf-8", delete=False
+    ) as f:
+        input_file = f.name
+        for key, article in pending.items():
+            write_line(f, build_request(key, article))
+    
+    try:
+        with open(input_file, "rb") as f:
+            uploaded = client.files.create(file=f, purpose="batch")
+        
+        batch = client.batches.create(
+            input_file_id=uploaded.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=COMPLETION_WINDOW,
+        )
+    except Exception:
+        os.remove(input_file)
+        raise
+    
+    # Keep the request file and all articles, with the custom ID of the request
+    # each one was submitted under, under the batch ID
+    os.replace(input_file, os.path.join(BATCH_DIR, f"{batch.id}_input.jsonl"))
+    with open(os.path.join(BATCH_DIR, f"{batch.id}_articles.jsonl"), "w", encoding="utf-8") as f:
+        for article in articles:
+            key = cache_key(article)
+            write_line(f, {"custom_id": key if key in pending else None, "article": article})
+    
+    logger.info(f"Submitted batch {batch.id} with {len(pending)} articles, {len(articles) - len(pending)} served from cache")
+    return batch.id
+
+
+def _parse_result_line(line: Dict, article: Dict) -> Dict:
+    """
+    Merge a single batch output line into its article.
+    
+    Args:
+        line (dict): Parsed batch output line
+        article (dict): The article the request was built from
+        
+    Returns:
+        dict: The article with added 'cities' and 'rationale' fields
+    """
+    article_result = article.copy()
+    
+    try:
+        if line.get("error"):
+            raise ValueError(line["error"])
+        content = line["response"]["body"]["choices"][0]["message"]["content"]
+        result = load_json_object(content)
+        article_result["cities"] = result.get("cities", [])
+        article_result["rationale"] = result.get("rationale", "No rationale provided")
+        
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        logger.error(f"Failed to parse batch result {line.get('custom_id')}: {e}")
+        article_result["cities"] = []
+        article_result["rationale"] = "Error parsing analysis results"
+        article_result["error"] = str(e)
+    
+    return article_result
+
+
+def collect_batch(batch_id: str) -> Optional[List[Dict]]:
+    """
+    Download the results of a completed batch job.
+    
+    Successful results are added to the analysis cache, and articles that were
+    skipped at submission because they were cached are filled in from it.
+    
+    Args:
+        batch_id (str): The ID returned by ``submit_batch``
+        
+    Returns:
+        list: The submitted articles with added city analysis results, in
+        submission order, or None if the batch has not completed yet
+        
+    Raises:
+        RuntimeError: If the batch job failed, expired, or was cancelled, or the
+            articles submitted with it cannot be found
+    """
+    client = _create_client()
+    batch = client.batches.retrieve(batch_id)
+    
+    if batch.status in ("failed", "expired", "cancelled"):
+        raise RuntimeError(f"Batch {batch_id} ended with status '{batch.status}'")
+    if batch.status != "completed":
+        logger.info(f"Batch {batch_id} is still {batch.status}")
+        return None
+    
+    articles_file = os.path.join(BATCH_DIR, f"{batch_id}_articles.jsonl")
+    if not os.path.exists(articles_file):
+        raise RuntimeError(f"Submitted articles for batch {batch_id} not found at {articles_file}")
+    
+    with open(articles_file, "r", encoding="utf-8") as f:
+        submitted = [json.loads(line) for line in f]
+    
+    lines = {}
+    if batch.output_file_id:
+        for raw_line in client.files.content(batch.output_file_id).text.splitlines():
+            if raw_line.strip():
+                line = json.loads(raw_line)
+                lines[line["custom_id"]] = line
+    
+    results = []
+    cache = AnalysisCache()
+    try:
+        for entry in submitted:
+            article = entry["article"]
+            key = cache_key(article)
+            custom_id = entry["custom_id"]
+            
+            if custom_id in lines:
+                article_result = _parse_result_line(lines[custom_id], article)
+                cache.set(key, article_result)
+            else:
+                # Cached at submission time, or a duplicate of a submitted article
+                # whose result has just been cached
+                cached = cache.get(key)
+                if cached is not None:
+                    article_result = {**article, **cached}
+                else:
+                    missing = {"custom_id": custom_id, "error": "No result returned for article"}
+                    article_result = _parse_result_line(missing, article)
+            
+            results.append(article_result)
+    finally:
+        cache.close()
+    
+    logger.info(f"Collected {len(results)} results from batch {batch_id}")
+    return results
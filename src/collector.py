@@ -3,9 +3,12 @@ News article collector for NewsLocator application.
 
 This module handles the collection of news articles from RSS feeds,
 specifically from Fox News. It fetches, parses, and normalizes the
-article data for further processing.
+article data for further processing. All configured feeds are fetched
+concurrently over a shared HTTP session with conditional requests, so an
+unchanged feed is served from a local copy instead of being downloaded again.
 
 Dependencies:
+    - aiohttp: For concurrent, conditional HTTP requests
     - feedparser: For RSS feed parsing
     - tenacity: For retry logic on network errors
     - logging: For error tracking
@@ -13,15 +16,18 @@ Dependencies:
 
 Usage:
     >>> from src.collector import collect_articles
-    >>> articles = collect_articles()
+    >>> articles = list(collect_articles())
     >>> print(f"Collected {len(articles)} articles")
 """
 
+import asyncio
+import hashlib
+import json
 import logging
 import os
-import time
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Iterator, List, Tuple
 
+import aiohttp
 import feedparser
 from dotenv import load_dotenv
 from tenacity import (
@@ -39,40 +45,160 @@ logger = logging.getLogger("newslocator.collector")
 
 # Configuration
 MAX_ARTICLES_PER_FEED = int(os.getenv("MAX_ARTICLES_PER_FEED", "5"))
-INTER_SOURCE_DELAY = int(os.getenv("INTER_SOURCE_DELAY", "5"))
+MAX_REQUESTS_PER_HOST = int(os.getenv("MAX_REQUESTS_PER_HOST", "2"))  # Concurrent feed requests per host
+
+FEED_TIMEOUT = 10  # Seconds to wait for a feed response
+FEED_STATE_PATH = "data/.feed_state.json"  # ETag and Last-Modified values per feed URL
+FEED_CACHE_DIR = "data/.feed_cache"  # Last downloaded body per feed URL
+
+# Network errors worth retrying; HTTP error statuses and malformed feeds are not
+RETRYABLE_FEED_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
 
 # Fox News RSS feed URL
 FOX_NEWS_RSS_URL = "https://moxie.foxnews.com/google-publisher/us.xml"
 
 
+def _load_feed_state() -> Dict[str, Dict[str, str]]:
+    """
+    Load the conditional request validators saved by previous runs.
+    
+    Returns:
+        dict: Mapping of feed URL to its 'etag' and 'modified' values
+    """
+    try:
+        with open(FEED_STATE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_feed_state(state: Dict[str, Dict[str, str]]):
+    """
+    Persist the conditional request validators for the next run.
+    
+    Args:
+        state (dict): Mapping of feed URL to its 'etag' and 'modified' values
+    """
+    os.makedirs(os.path.dirname(FEED_STATE_PATH), exist_ok=True)
+    with open(FEED_STATE_PATH, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+def _feed_cache_path(url: str) -> str:
+    """
+    Get the path of the locally cached body for a feed URL.
+    
+    Args:
+        url (str): The URL of the RSS feed
+        
+    Returns:
+        str: Path of the cached feed body
+    """
+    digest = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(FEED_CACHE_DIR, f"{digest}.xml")
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=2, max=10),
-    retry=retry_if_exception_type((Exception)),
+    retry=retry_if_exception_type(RETRYABLE_FEED_ERRORS),
+    reraise=True,
 )
-def fetch_feed(url: str) -> feedparser.FeedParserDict:
+async def fetch_feed(
+    session: aiohttp.ClientSession,
+    url: str,
+    state: Dict[str, Dict[str, str]],
+) -> feedparser.FeedParserDict:
     """
     Fetch and parse an RSS feed with retry logic.
     
+    Sends the ETag and Last-Modified values from the previous fetch, and parses
+    the locally cached copy when the server reports the feed as unchanged.
+    
     Args:
+        session (aiohttp.ClientSession): Shared HTTP session to fetch with
         url (str): The URL of the RSS feed to fetch
+        state (dict): Conditional request validators per feed URL, updated in place
         
     Returns:
         feedparser.FeedParserDict: The parsed feed
         
     Raises:
-        Exception: If the feed cannot be fetched after retries
+        aiohttp.ClientError: If the feed cannot be fetched, after retrying
+            connection errors
+        asyncio.TimeoutError: If the feed request keeps timing out
+        Exception: If the feed cannot be parsed
     """
     logger.info(f"Fetching feed from {url}")
-    feed = feedparser.parse(url)
+    validators = state.get(url, {})
+    cache_path = _feed_cache_path(url)
+    
+    # Only make the request conditional if there is a cached body to fall back on
+    headers = {}
+    if os.path.exists(cache_path):
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("modified"):
+            headers["If-Modified-Since"] = validators["modified"]
+    
+    async with session.get(url, headers=headers) as response:
+        if response.status == 304:
+            logger.info(f"Feed {url} not modified since last fetch, using cached copy")
+            with open(cache_path, "rb") as f:
+                content = f.read()
+        else:
+            response.raise_for_status()
+            content = await response.read()
+    
+    # Parsing is CPU-bound and stays synchronous
+    feed = feedparser.parse(content)
     
     if feed.get("bozo_exception"):
         logger.error(f"Error parsing feed: {feed.bozo_exception}")
         raise Exception(f"Failed to parse feed: {feed.bozo_exception}")
     
+    # Remember the new body and validators for the next conditional request
+    if response.status != 304:
+        os.makedirs(FEED_CACHE_DIR, exist_ok=True)
+        with open(cache_path, "wb") as f:
+            f.write(content)
+        state[url] = {
+            "etag": response.headers.get("ETag", ""),
+            "modified": response.headers.get("Last-Modified", ""),
+        }
+    
     return feed
 
 
+def _normalize_fox_news_entry(entry: feedparser.FeedParserDict) -> Dict[str, Any]:
+    """
+    Normalize a single Fox News feed entry into an article dictionary.
+    
+    Args:
+        entry (feedparser.FeedParserDict): A feed entry
+        
+    Returns:
+        dict: Article dictionary with normalized data
+    """
+    # Extract categories if available
+    tags = entry.get("tags") or []
+    categories = [tag.get("term") for tag in tags if tag.get("term")]
+    
+    # Extract content from the entry, falling back to the summary
+    content_list = entry.get("content")
+    content = content_list[0].get("value", "") if content_list else entry.get("summary", "")
+    
+    return {
+        "title": entry.get("title", ""),
+        "published": entry.get("published", ""),
+        "description": entry.get("description", ""),
+        "content": content,
+        "link": entry.get("link", ""),
+        "categories": categories,
+        "source": "fox_news",
+    }
+
+
 def parse_fox_news_feed(feed: feedparser.FeedParserDict) -> List[Dict[str, Any]]:
     """
     Parse Fox News RSS feed into a list of article dictionaries.
@@ -83,64 +209,68 @@ def parse_fox_news_feed(feed: feedparser.FeedParserDict) -> List[Dict[str, Any]]
     Returns:
         list: List of article dictionaries with normalized data
     """
-    articles = []
+    return list(map(_normalize_fox_news_entry, feed.entries[:MAX_ARTICLES_PER_FEED]))
+
+
+# Feeds to collect from: (source name, feed URL, parser)
+FEED_SOURCES: List[Tuple[str, str, Callable[[feedparser.FeedParserDict], List[Dict[str, Any]]]]] = [
+    ("Fox News", FOX_NEWS_RSS_URL, parse_fox_news_feed),
+]
+
+
+async def fetch_all_feeds() -> List[Tuple[str, Any]]:
+    """
+    Fetch every configured feed concurrently.
     
-    for entry in feed.entries[:MAX_ARTICLES_PER_FEED]:
-        # Extract categories if available
-        categories = []
-        if hasattr(entry, "tags"):
-            categories = [tag.term for tag in entry.tags if hasattr(tag, "term")]
-        
-        # Extract content from the entry
-        content = ""
-        if hasattr(entry, "content") and entry.content:
-            content = entry.content[0].value
-        elif hasattr(entry, "summary"):
-            content = entry.summary
-        
-        # Create normalized article dictionary
-        article = {
-            "title": entry.get("title", ""),
-            "published": entry.get("published", ""),
-            "description": entry.get("description", ""),
-            "content": content,
-            "link": entry.get("link", ""),
-            "categories": categories,
-            "source": "fox_news",
-        }
-        
-        articles.append(article)
+    Returns:
+        list: (source name, parsed feed or the exception raised) for each source,
+        in the order of ``FEED_SOURCES``
+    """
+    state = _load_feed_state()
+    timeout = aiohttp.ClientTimeout(total=FEED_TIMEOUT)
+    connector = aiohttp.TCPConnector(limit_per_host=MAX_REQUESTS_PER_HOST)
     
-    return articles
+    async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+        feeds = await asyncio.gather(
+            *[fetch_feed(session, url, state) for _, url, _ in FEED_SOURCES],
+            return_exceptions=True,
+        )
+    
+    _save_feed_state(state)
+    return [(name, feed) for (name, _, _), feed in zip(FEED_SOURCES, feeds)]
 
 
-def collect_articles() -> List[Dict[str, Any]]:
+def collect_articles() -> Iterator[Dict[str, Any]]:
     """
-    Collect articles from Fox News RSS feed.
+    Collect articles from all configured RSS feeds.
     
-    Returns:
-        list: List of article dictionaries with normalized data
+    The feeds are fetched concurrently, then articles are yielded one at a time
+    as they are parsed, so callers can write or process each article without
+    waiting for the whole collection.
+    
+    Yields:
+        dict: Article dictionary with normalized data
     """
-    all_articles = []
+    parsers = {name: parser for name, _, parser in FEED_SOURCES}
     
-    try:
-        # Fetch and parse Fox News feed
-        feed = fetch_feed(FOX_NEWS_RSS_URL)
-        articles = parse_fox_news_feed(feed)
-        
-        logger.info(f"Collected {len(articles)} articles from Fox News")
-        all_articles.extend(articles)
+    for name, feed in asyncio.run(fetch_all_feeds()):
+        if isinstance(feed, Exception):
+            logger.error(f"Error collecting articles from {name}: {feed}")
+            continue
         
-    except Exception as e:
-        logger.error(f"Error collecting articles from Fox News: {e}")
-    
-    return all_articles
+        try:
+            articles = parsers[name](feed)
+            logger.info(f"Collected {len(articles)} articles from {name}")
+            yield from articles
+            
+        except Exception as e:
+            logger.error(f"Error collecting articles from {name}: {e}")
 
 
 if __name__ == "__main__":
     # For testing the module directly
     logging.basicConfig(level=logging.INFO)
-    articles = collect_articles()
+    articles = list(collect_articles())
     print(f"Collected {len(articles)} articles")
     for article in articles:
         print(f"- {article['title']}") 
\ No newline at end of file
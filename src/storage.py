@@ -0,0 +1,74 @@
+"""
+JSON Lines storage helpers for NewsLocator.
+
+This module serializes records as compact JSON, one object per line, so that
+articles and analysis results can be appended to disk as soon as they are
+available instead of being dumped in one go at the end of a run. Output is
+compact and keeps non-ASCII text as-is; indented output is only produced on
+request. orjson is used when installed, falling back to the standard library
+json module.
+
+Dependencies:
+    - orjson (optional): For faster JSON serialization
+
+Usage:
+    >>> from src.storage import write_line, write_pretty
+    >>> with open("data/articles.jsonl", "w", encoding="utf-8") as f:
+    ...     write_line(f, {"title": "London faces flooding"})
+    >>> write_pretty("output/analysis.json", [{"title": "London faces flooding"}])
+"""
+
+import json
+from typing import Any, Dict, List, TextIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+# Encoders configured once rather than on every call
+_COMPACT_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_PRETTY_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def dumps(record: Dict[str, Any]) -> str:
+    """
+    Serialize a record as compact JSON.
+    
+    Args:
+        record (dict): The record to serialize
+        
+    Returns:
+        str: The JSON text without insignificant whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(record).decode("utf-8")
+    return _COMPACT_ENCODER.encode(record)
+
+
+def write_line(f: TextIO, record: Dict[str, Any]):
+    """
+    Append a record to a JSON Lines file and flush it to disk.
+    
+    Args:
+        f (TextIO): File opened for writing in text mode
+        record (dict): The record to write
+    """
+    f.write(dumps(record) + "\n")
+    f.flush()
+
+
+def write_pretty(path: str, records: List[Dict[str, Any]]):
+    """
+    Write records to a file as an indented JSON array for human reading.
+    
+    Args:
+        path (str): Path of the file to write
+        records (list): The records to write
+    """
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(_PRETTY_ENCODER.encode(records))